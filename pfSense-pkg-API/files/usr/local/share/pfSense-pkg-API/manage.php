@@ -14,6 +14,8 @@
 //   See the License for the specific language governing permissions and
 //   limitations under the License.
 require_once("api/framework/APITools.inc");
+require_once("api/framework/APIAutoloader.inc");
+require_once("api/framework/APIRouter.inc");
 
 function build_endpoints() {
     # Import each endpoint class
@@ -43,6 +45,65 @@ function build_endpoints() {
             exit(1);
         }
     }
+
+    # Map each API class to its file so requests only load the classes they use
+    if (APIAutoloader\build_class_map() !== false) {
+        echo "Building API class map at \"".APIAutoloader\CLASS_MAP_PATH."\"... done.".PHP_EOL;
+    } else {
+        echo "Building API class map at \"".APIAutoloader\CLASS_MAP_PATH."\"... failed.".PHP_EOL;
+        exit(1);
+    }
+
+    # Build the route table, this is also used to look up endpoints by URL (e.g. for transactions)
+    if (APIRouter::build_routes() !== false) {
+        echo "Building API route table at \"".APIRouter::ROUTES_PATH."\"... done.".PHP_EOL;
+    } else {
+        echo "Building API route table at \"".APIRouter::ROUTES_PATH."\"... failed.".PHP_EOL;
+        exit(1);
+    }
+
+    # Build the front controller, URLs without an endpoint index.php fall back to it and receive a not found error
+    if (APIRouter::build_front_controller()) {
+        echo "Building API front controller at \"".APIRouter::FRONT_CONTROLLER_PATH."\"... done.".PHP_EOL;
+    } else {
+        echo "Building API front controller at \"".APIRouter::FRONT_CONTROLLER_PATH."\"... failed.".PHP_EOL;
+        exit(1);
+    }
+}
+
+function build_router() {
+    # Build the route table used by the front controller
+    $routes = APIRouter::build_routes();
+    if ($routes !== false) {
+        echo "Building API route table at \"".APIRouter::ROUTES_PATH."\"... done.".PHP_EOL;
+    } else {
+        echo "Building API route table at \"".APIRouter::ROUTES_PATH."\"... failed.".PHP_EOL;
+        exit(1);
+    }
+
+    # Build the class map used to load each endpoint's models
+    if (APIAutoloader\build_class_map() !== false) {
+        echo "Building API class map at \"".APIAutoloader\CLASS_MAP_PATH."\"... done.".PHP_EOL;
+    } else {
+        echo "Building API class map at \"".APIAutoloader\CLASS_MAP_PATH."\"... failed.".PHP_EOL;
+        exit(1);
+    }
+
+    # Remove each endpoint's index.php file so requests fall back to the front controller
+    foreach ($routes as $url => $route) {
+        if (is_file("/usr/local/www".$url."/index.php")) {
+            unlink("/usr/local/www".$url."/index.php");
+        }
+    }
+    echo "Removing API endpoint index files... done.".PHP_EOL;
+
+    # Write the front controller
+    if (APIRouter::build_front_controller()) {
+        echo "Building API front controller at \"".APIRouter::FRONT_CONTROLLER_PATH."\"... done.".PHP_EOL;
+    } else {
+        echo "Building API front controller at \"".APIRouter::FRONT_CONTROLLER_PATH."\"... failed.".PHP_EOL;
+        exit(1);
+    }
 }
 
 function backup() {
@@ -139,7 +200,8 @@ function help() {
     echo "COMMANDS:".PHP_EOL;
     echo "  version          : Display the current package version and build information".PHP_EOL;
     echo "  help             : Display the help page (this page)".PHP_EOL;
-    echo "  buildendpoints   : Build all API endpoints included in this package".PHP_EOL;
+    echo "  buildendpoints   : Build all API endpoints, the API class map and the API route table".PHP_EOL;
+    echo "  buildrouter      : Replace the endpoints built by buildendpoints with a single API front controller".PHP_EOL;
     echo "  update           : Update package to the latest stable version available".PHP_EOL;
     echo "  revert           : Revert package to a specified version".PHP_EOL;
     echo "  delete           : Delete package from this system".PHP_EOL;
@@ -154,6 +216,10 @@ function help() {
 if (in_array($argv[1], ["buildendpoints"])) {
     build_endpoints();
 }
+# BUILDROUTER COMMAND
+elseif (in_array($argv[1], ["buildrouter"])) {
+    build_router();
+}
 # BACKUP COMMAND
 elseif (in_array($argv[1], ["backup"])) {
     backup();
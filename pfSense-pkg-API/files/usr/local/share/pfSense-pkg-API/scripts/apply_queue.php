@@ -0,0 +1,24 @@
+<?php
+//   Copyright 2022 Jared Hendrickson
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+
+
+# This script is started in the background by API endpoints that request a firewall filter reload while an apply delay
+# is configured. It waits until the pending reload is due, reloads the filter once and exits when no reload is pending.
+#
+# Example: php -f apply_queue.php
+
+require_once("api/framework/APIApplyQueue.inc");
+
+APIApplyQueue::run();
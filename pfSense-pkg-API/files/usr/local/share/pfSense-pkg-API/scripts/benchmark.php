@@ -0,0 +1,133 @@
+<?php
+//   Copyright 2022 Jared Hendrickson
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+
+
+# This script benchmarks API framework internals to compare the cost of different approaches on a live system. Each
+# benchmark runs its samples in a fresh PHP process so that each sample represents the cost of a single API request.
+# ---------------------------------------------------------------------------------------------------------------
+# Argument 'benchmark': required : the name of the benchmark to run (autoload, response, encode)
+# Argument 'iterations': optional : the number of samples to take for each mode (defaults to 25)
+#
+# Example: php -f benchmark.php autoload iterations=50
+
+require_once("api/framework/APITools.inc");
+
+# Runs PHP code in a fresh process and returns the elapsed time and peak memory the code reported
+function run_sample($code) {
+    $output = shell_exec("/usr/local/bin/php -r ".escapeshellarg($code));
+    return json_decode(trim($output), true);
+}
+
+# Runs each mode of a benchmark for a number of iterations and prints the average of the samples
+function run_benchmark($name, $modes, $iterations) {
+    echo "Benchmark: ".$name." (".$iterations." iterations per mode)".PHP_EOL;
+    foreach ($modes as $mode => $code) {
+        $time = 0;
+        $memory = 0;
+
+        # Take each sample and keep a running total
+        for ($i = 0; $i < $iterations; $i++) {
+            $sample = run_sample($code);
+            $time += $sample["time"];
+            $memory += $sample["memory"];
+        }
+
+        # Print our averages for this mode
+        printf(
+            "  %-10s : %8.3f ms avg, %8.1f KiB avg peak memory".PHP_EOL,
+            $mode,
+            ($time / $iterations) * 1000,
+            ($memory / $iterations) / 1024
+        );
+    }
+}
+
+# Compares eagerly requiring every API model (before) against the API autoloader (after) for a firewall rule GET
+function benchmark_autoload($iterations) {
+    # Both modes bootstrap the framework outside of the timed section, only class loading is timed
+    $setup = 'require_once("api/framework/APIModel.inc"); require_once("api/framework/APIQuery.inc");';
+    $result = 'echo json_encode(["time" => microtime(true) - $start, "memory" => memory_get_peak_usage()]);';
+    $classes = '["APIFirewallRuleRead", "APIFirewallRuleCreate", "APIFirewallRuleUpdate", "APIFirewallRuleDelete"]';
+    $modes = [
+        "before" => $setup.'$start = microtime(true);
+            foreach (glob("/etc/inc/api/models/*.inc") as $model) { require_once($model); }
+            foreach ('.$classes.' as $class) { class_exists($class, false); }'.$result,
+        "after" => $setup.'$start = microtime(true);
+            require_once("api/framework/APIAutoloader.inc");
+            foreach ('.$classes.' as $class) { class_exists($class); }'.$result
+    ];
+    run_benchmark("autoload", $modes, $iterations);
+}
+
+# Compares rebuilding the response library on each call (before) against the constant response library (after)
+function benchmark_response($iterations) {
+    # The legacy get() is recreated from the current library so both modes pull identical responses
+    $setup = <<<'PHP'
+        require_once("api/framework/APIResponse.inc");
+        $library = preg_replace("/'return' => \d+/", "'return' => \$id", var_export(APIResponse\RESPONSES, true));
+        eval('function legacy_get($id, $data=[]) {
+            $responses = '.$library.';
+            $response = $responses[(array_key_exists($id, $responses)) ? $id : 1];
+            $response["data"] = $data;
+            return $response;
+        }');
+        $ids = array_keys(APIResponse\RESPONSES);
+    PHP;
+    $result = 'echo json_encode(["time" => microtime(true) - $start, "memory" => memory_get_peak_usage()]);';
+    $modes = [
+        "before" => $setup.'$start = microtime(true);
+            for ($i = 0; $i < 1000; $i++) { legacy_get($ids[$i % count($ids)], []); }'.$result,
+        "after" => $setup.'$start = microtime(true);
+            for ($i = 0; $i < 1000; $i++) { APIResponse\get($ids[$i % count($ids)], []); }'.$result
+    ];
+    run_benchmark("response (1000 get() calls per sample)", $modes, $iterations);
+}
+
+# Compares encoding a large response with json_encode() (before) against the streaming JSON encoder (after)
+function benchmark_encode($iterations) {
+    # Both modes encode the same 100000 item response and discard the output in 4 KiB chunks like a web server would
+    $setup = <<<'PHP'
+        require_once("api/framework/APIEndpoint.inc");
+        $resp = APIResponse\get(0, array_fill(0, 100000, ["interface" => "wan", "state" => "ESTABLISHED:ESTABLISHED"]));
+        ob_start(function() { return ""; }, 4096);
+    PHP;
+    $result = 'ob_end_clean(); echo json_encode(["time" => microtime(true) - $start, "memory" => memory_get_peak_usage()]);';
+    $modes = [
+        "before" => $setup.'$start = microtime(true); echo json_encode($resp).PHP_EOL;'.$result,
+        "after" => $setup.'$start = microtime(true); (new APIEndpoint())->stream_json($resp);'.$result
+    ];
+    run_benchmark("encode (100000 item response per sample)", $modes, $iterations);
+}
+
+# Variables
+$benchmarks = ["autoload", "response", "encode"];
+$benchmark = $argv[1];
+$iterations = 25;
+
+# Loop through all passed in arguments and extract our expected arguments
+foreach ($argv as $id=>$arg) {
+    # Look for our iterations argument
+    if (APITools\str_starts_with("iterations=", $arg)) {
+        $iterations = max(1, intval(str_replace("iterations=", "", $arg)));
+    }
+}
+
+# Run the requested benchmark if it exists
+if (in_array($benchmark, $benchmarks)) {
+    call_user_func("benchmark_".$benchmark, $iterations);
+} else {
+    echo "Error: Unknown benchmark. Choose from: ".implode(", ", $benchmarks).PHP_EOL;
+    exit(1);
+}
@@ -0,0 +1,25 @@
+<?php
+//   Copyright 2022 Jared Hendrickson
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+
+
+# This script is started in the background when an API request is queued as a job. It runs each queued job in the
+# order it was queued and exits once no jobs are left. Only one instance runs jobs at a time, others exit immediately.
+#
+# Example: php -f jobs.php
+
+require_once("api/framework/APIModel.inc");
+require_once("api/framework/APIAutoloader.inc");    // Lazily loads the API model class of each job
+
+APIJobQueue::run();
@@ -0,0 +1,24 @@
+<?php
+//   Copyright 2022 Jared Hendrickson
+//
+//   Licensed under the Apache License, Version 2.0 (the "License");
+//   you may not use this file except in compliance with the License.
+//   You may obtain a copy of the License at
+//
+//       http://www.apache.org/licenses/LICENSE-2.0
+//
+//   Unless required by applicable law or agreed to in writing, software
+//   distributed under the License is distributed on an "AS IS" BASIS,
+//   WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+//   See the License for the specific language governing permissions and
+//   limitations under the License.
+
+
+# This script is started in the background by API endpoints that read system metrics. It collects a snapshot of the
+# system metrics on an interval and exits once the metrics have not been read for a while.
+#
+# Example: php -f system_metrics.php
+
+require_once("api/framework/APISystemMetrics.inc");
+
+APISystemMetrics::run();
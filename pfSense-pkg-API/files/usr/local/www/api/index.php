@@ -84,6 +84,23 @@ if (isset($_POST["save"])) {
         $pkg_config["jwt_exp"] = $_POST["jwt_exp"];
     }
 
+    # Save JWT refresh expiration value to config, this must be within range
+    if (isset($_POST["jwt_refresh_exp"])) {
+        if (is_numeric($_POST["jwt_refresh_exp"]) and $_POST["jwt_refresh_exp"] >= 300 and $_POST["jwt_refresh_exp"] <= 2592000) {
+            $pkg_config["jwt_refresh_exp"] = intval($_POST["jwt_refresh_exp"]);
+        } else {
+            $input_errors[] = "JWT refresh expiration must be between 300 and 2592000 seconds.";
+            $has_errors = true;
+        }
+    }
+
+    # Save our JWT privileges value
+    if (isset($_POST["jwt_privileges"])) {
+        $pkg_config["jwt_privileges"] = "";
+    } else {
+        unset($pkg_config["jwt_privileges"]);
+    }
+
     # Save key hash algos to config
     if (isset($_POST["keyhash"])) {
         $pkg_config["keyhash"] = $_POST["keyhash"];
@@ -140,6 +157,34 @@ if (isset($_POST["save"])) {
         unset($pkg_config["custom_headers"]);
     }
 
+    # Save our apply delay values, these must be within range
+    if (isset($_POST["apply_delay"])) {
+        if (is_numeric($_POST["apply_delay"]) and $_POST["apply_delay"] >= 0 and $_POST["apply_delay"] <= 60) {
+            $pkg_config["apply_delay"] = intval($_POST["apply_delay"]);
+        } else {
+            $input_errors[] = "Apply delay must be between 0 and 60 seconds.";
+            $has_errors = true;
+        }
+    }
+    if (isset($_POST["apply_max_delay"])) {
+        if (is_numeric($_POST["apply_max_delay"]) and $_POST["apply_max_delay"] >= 1 and $_POST["apply_max_delay"] <= 300) {
+            $pkg_config["apply_max_delay"] = intval($_POST["apply_max_delay"]);
+        } else {
+            $input_errors[] = "Apply max delay must be between 1 and 300 seconds.";
+            $has_errors = true;
+        }
+    }
+
+    # Save our auth cache TTL value, this must be within range
+    if (isset($_POST["auth_cache_ttl"])) {
+        if (is_numeric($_POST["auth_cache_ttl"]) and $_POST["auth_cache_ttl"] >= 0 and $_POST["auth_cache_ttl"] <= 300) {
+            $pkg_config["auth_cache_ttl"] = intval($_POST["auth_cache_ttl"]);
+        } else {
+            $input_errors[] = "Auth cache TTL must be between 0 and 300 seconds.";
+            $has_errors = true;
+        }
+    }
+
     # Validate subnets within the specified access list
     if (!empty($_POST["access_list"])) {
         # Convert access list to array and remove line breaks
@@ -316,6 +361,26 @@ $jwt_section->addInput(new Form_Input(
     "How long (in seconds) the JWT is valid for. Allows a minimum of 300 seconds (5 minutes) and maximum of 
     86400 seconds (1 day)."
 );
+$jwt_section->addInput(new Form_Input(
+    'jwt_refresh_exp',
+    'JWT Refresh Expiration',
+    'number',
+    (isset($pkg_config["jwt_refresh_exp"])) ? $pkg_config["jwt_refresh_exp"] : APITools\JWT_DEFAULT_REFRESH_EXP,
+    ["min"=>300, "max"=>2592000]
+))->setHelp(
+    "How long (in seconds) the refresh token is valid for. Refresh tokens can be used to obtain a new JWT without
+    credentials. Allows a minimum of 300 seconds (5 minutes) and maximum of 2592000 seconds (30 days)."
+);
+$jwt_section->addInput(new Form_Checkbox(
+    'jwt_privileges',
+    'Include Privileges',
+    'Include user privileges in JWTs',
+    isset($pkg_config["jwt_privileges"]),
+    ''
+))->setHelp(
+    "Include the user's privileges in each JWT so the privileges do not need to be looked up on each API call. The
+    privileges in a JWT are only used until the configuration changes, after which they are looked up again."
+);
 
 ### Populate the ADVANCED section of the UI form
 $advanced_section->addClass("hide-api-advanced-settings");
@@ -372,6 +437,38 @@ $advanced_section->addInput(new Form_Textarea(
      For example, this can be used to set CORS policy headers required by frontend web applications.'
 );
 
+$advanced_section->addInput(new Form_Input(
+    'apply_delay',
+    'Apply Delay',
+    'number',
+    (isset($pkg_config["apply_delay"])) ? $pkg_config["apply_delay"] : 0,
+    ["min"=>0, "max"=>60]
+))->setHelp(
+    "How long (in seconds) to wait for further changes before reloading the firewall filter after an API call requests
+    a reload. Reloads requested while waiting are combined into a single reload. Set to 0 to reload immediately."
+);
+$advanced_section->addInput(new Form_Input(
+    'apply_max_delay',
+    'Apply Max Delay',
+    'number',
+    (isset($pkg_config["apply_max_delay"])) ? $pkg_config["apply_max_delay"] : 10,
+    ["min"=>1, "max"=>300]
+))->setHelp(
+    "The longest time (in seconds) a requested firewall filter reload may be delayed by the apply delay."
+);
+
+$advanced_section->addInput(new Form_Input(
+    'auth_cache_ttl',
+    'Auth Cache TTL',
+    'number',
+    (isset($pkg_config["auth_cache_ttl"])) ? $pkg_config["auth_cache_ttl"] : 0,
+    ["min"=>0, "max"=>300]
+))->setHelp(
+    "How long (in seconds) a successful local database authentication is remembered so repeated API calls with the
+    same credentials skip the password or authentication server check. Remembered credentials are forgotten when the
+    user or authentication servers change. Only applies to the local database authentication mode. Set to 0 to disable."
+);
+
 $advanced_section->addInput(new Form_Textarea(
     'access_list',
     'Allowed Networks',
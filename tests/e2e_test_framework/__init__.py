@@ -141,6 +141,9 @@ class APIE2ETest:
                 "Authorization": "Bearer " + self.__request_jwt__(test_params.get("auth_payload", self.auth_payload))
             }
 
+        # Add any custom headers required by the test
+        headers.update(test_params.get("headers", {}))
+
         # Attempt to make the API call, if the request times out print timeout error
         try:
             req = requests.request(
@@ -158,9 +161,9 @@ class APIE2ETest:
         # If this is a request only execution, just return the request/response object
         if req_only:
             return req
-        # Otherwise, check if the response is valid
+        # Otherwise, check if the response is valid. Responses without a body return an empty dictionary.
         elif self.check_response(req, test_params, verbose=self.args.verbose):
-            return req.json()
+            return req.json() if req.content else {}
 
     @staticmethod
     def has_json_response(req):
@@ -171,6 +174,13 @@ class APIE2ETest:
         except json.decoder.JSONDecodeError:
             return False
 
+    @staticmethod
+    def has_expected_body(req, test_params):
+        # Check if our response has a JSON body, or no body if the test expects an empty body
+        if test_params.get("empty_body", False):
+            return not req.content
+        return APIE2ETest.has_json_response(req)
+
     @staticmethod
     def has_correct_http_status(req, test_params):
         # Check if our HTTP status was expect
@@ -181,12 +191,23 @@ class APIE2ETest:
 
     @staticmethod
     def has_correct_return_code(req, test_params):
-        # Check if our HTTP status was expect
-        if APIE2ETest.has_json_response(req) and req.json()["return"] == test_params.get("return", 0):
+        # Check if our HTTP status was expect, responses without a body have no return code
+        if test_params.get("empty_body", False):
+            return True
+        elif APIE2ETest.has_json_response(req) and req.json()["return"] == test_params.get("return", 0):
             return True
         else:
             return False
 
+    @staticmethod
+    def has_json_encoded_response(req, test_params):
+        # Check if our response body is exactly what PHP's json_encode() would produce for the same response. PHP
+        # escapes forward slashes, which only occur within strings of the encoded JSON.
+        if not test_params.get("json_encoded", False):
+            return True
+        encoded = json.dumps(req.json(), separators=(",", ":")).replace("/", "\\/")
+        return req.content.decode().rstrip("\n") == encoded
+
     @staticmethod
     def has_correct_resp_time(req, test_params):
         # Check if response time is within an acceptable threshold. Allow within 1 second variance.
@@ -200,8 +221,9 @@ class APIE2ETest:
         valid = False
 
         # Run each check and print the results
-        if not APIE2ETest.has_json_response(req):
-            msg = "Expected JSON response, received {content}".format(content=req.content)
+        if not APIE2ETest.has_expected_body(req, test_params):
+            expected = "empty" if test_params.get("empty_body", False) else "JSON"
+            msg = "Expected {e} response, received {content}".format(e=expected, content=req.content)
             print(self.__format_msg__(req.request.method, test_params, msg))
         elif not APIE2ETest.has_correct_http_status(req, test_params):
             received_status = req.status_code
@@ -213,6 +235,9 @@ class APIE2ETest:
             expected_return = test_params.get("return", 0)
             msg = "Expected return code {e}, received {r}".format(e=expected_return, r=received_return)
             print(self.__format_msg__(req.request.method, test_params, msg))
+        elif not APIE2ETest.has_json_encoded_response(req, test_params):
+            msg = "Expected response body to match json_encode(), received {content}".format(content=req.content)
+            print(self.__format_msg__(req.request.method, test_params, msg))
         elif not APIE2ETest.has_correct_resp_time(req, test_params):
             received_resp_time = req.elapsed.total_seconds()
             expected_resp_time = test_params.get("resp_time", 1)
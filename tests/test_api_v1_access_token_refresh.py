@@ -0,0 +1,130 @@
+# Copyright 2022 Jared Hendrickson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import e2e_test_framework
+
+
+class APIE2ETestAccessTokenRefresh(e2e_test_framework.APIE2ETest):
+    uri = "/api/v1/access_token/refresh"
+    post_tests = [
+        {
+            "name": "Request an access token and refresh token",
+            "uri": "/api/v1/access_token",
+            "credentials": True    # Locator for tests that need the admin credentials added by post()
+        },
+        {
+            "name": "Refresh the access token",
+            "payload": {}
+        },
+        {
+            "name": "Check refresh tokens cannot be used again",
+            "status": 401,
+            "return": 28,
+            "payload": {}
+        },
+        {
+            "name": "Refresh the access token using the rotated refresh token",
+            "payload": {}
+        },
+        {
+            "name": "Check refresh tokens cannot authenticate other API calls",
+            "uri": "/api/v1/system/version",
+            "method": "GET",
+            "status": 401,
+            "return": 3,
+            "headers": {}
+        },
+        {
+            "name": "Check refresh token validation",
+            "status": 401,
+            "return": 28,
+            "payload": {"refresh_token": "INVALID"}
+        },
+        {
+            "name": "Enable privileges in access tokens",
+            "uri": "/api/v1/system/api",
+            "method": "PUT",
+            "payload": {"jwt_privileges": True}
+        },
+        {
+            "name": "Create a user that may read the system version",
+            "uri": "/api/v1/user",
+            "resp_time": 2,    # Allow a couple seconds for user database to be updated
+            "payload": {"username": "e2e_refresh_user", "password": "changeme", "priv": ["page-dashboard-widgets"]}
+        },
+        {
+            "name": "Request an access token containing the user's privileges",
+            "uri": "/api/v1/access_token",
+            "payload": {"client-id": "e2e_refresh_user", "client-token": "changeme"}
+        },
+        {
+            "name": "Read the system version using the privileges in the access token",
+            "uri": "/api/v1/system/version",
+            "method": "GET",
+            "headers": {}
+        },
+        {
+            "name": "Remove the user's privilege to read the system version",
+            "uri": "/api/v1/user",
+            "method": "PUT",
+            "resp_time": 2,    # Allow a couple seconds for user database to be updated
+            "payload": {"username": "e2e_refresh_user", "priv": ["page-system-usermanager"]}
+        },
+        {
+            "name": "Check privileges in access tokens are not trusted after the configuration changes",
+            "uri": "/api/v1/system/version",
+            "method": "GET",
+            "status": 403,
+            "return": 4,
+            "headers": {}
+        },
+        {
+            "name": "Delete the user",
+            "uri": "/api/v1/user",
+            "method": "DELETE",
+            "payload": {"username": "e2e_refresh_user"}
+        },
+        {
+            "name": "Disable privileges in access tokens",
+            "uri": "/api/v1/system/api",
+            "method": "PUT",
+            "payload": {"jwt_privileges": False}
+        }
+    ]
+
+    def post(self):
+        # Refresh tokens are only issued when the API uses JWT authentication
+        if self.args.auth_mode != "jwt":
+            self.post_tests = [{"name": "Check JWT auth mode requirement", "status": 403, "return": 9}]
+        for test in self.post_tests:
+            if test.get("credentials"):
+                test["payload"] = dict(self.auth_payload)
+        super().post()
+
+    def post_post(self):
+        # Add the tokens returned by earlier tests to the tests that use them
+        responses = self.post_responses
+        if len(responses) == 1 and responses[0]:
+            self.post_tests[1]["payload"]["refresh_token"] = responses[0]["data"]["refresh_token"]
+            self.post_tests[2]["payload"]["refresh_token"] = responses[0]["data"]["refresh_token"]
+        elif len(responses) == 2 and responses[1]:
+            self.post_tests[3]["payload"]["refresh_token"] = responses[1]["data"]["refresh_token"]
+        elif len(responses) == 4 and responses[3]:
+            self.post_tests[4]["headers"]["Authorization"] = "Bearer " + responses[3]["data"]["refresh_token"]
+        elif len(responses) == 9 and responses[8]:
+            self.post_tests[9]["headers"]["Authorization"] = "Bearer " + responses[8]["data"]["token"]
+            self.post_tests[11]["headers"]["Authorization"] = "Bearer " + responses[8]["data"]["token"]
+
+
+APIE2ETestAccessTokenRefresh()
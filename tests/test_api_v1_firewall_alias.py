@@ -17,7 +17,17 @@ import e2e_test_framework
 class APIE2ETestFirewallAlias(e2e_test_framework.APIE2ETest):
     uri = "/api/v1/firewall/alias"
     get_tests = [
-        {"name": "Read all aliases"}
+        {"name": "Read all aliases"},
+        {
+            "name": "Check outdated ETags return the full response",
+            "headers": {"If-None-Match": '"outdated"'}
+        },
+        {
+            "name": "Check matching ETags return not modified without a body",
+            "status": 304,
+            "empty_body": True,
+            "headers": {}    # The ETag of the first GET test's response is added by post_get()
+        }
     ]
     post_tests = [
         {
@@ -251,4 +261,10 @@ class APIE2ETestFirewallAlias(e2e_test_framework.APIE2ETest):
 
     ]
 
+    def post_get(self):
+        # Request the ETag of the response read by the first GET test, the configuration is unchanged between GET tests
+        if len(self.get_responses) == 1:
+            req = self.make_request("GET", {}, req_only=True)
+            self.get_tests[2]["headers"]["If-None-Match"] = req.headers.get("ETag", "") if req is not None else ""
+
 APIE2ETestFirewallAlias()
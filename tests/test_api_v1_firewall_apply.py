@@ -0,0 +1,39 @@
+# Copyright 2022 Jared Hendrickson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import e2e_test_framework
+
+class APIE2ETestFirewallApply(e2e_test_framework.APIE2ETest):
+    uri = "/api/v1/firewall/apply"
+    get_tests = [{"name": "Read firewall apply status"}]
+    post_tests = [
+        {"name": "Apply firewall changes", "resp_time": 5},
+        {
+            "name": "Delay firewall reloads",
+            "uri": "/api/v1/system/api",
+            "method": "PUT",
+            "payload": {"apply_delay": 2, "apply_max_delay": 5}
+        },
+        {"name": "Request a delayed firewall reload"},
+        {"name": "Request another delayed firewall reload"},
+        {"name": "Read the pending firewall reload", "method": "GET"},
+        {
+            "name": "Reload firewall immediately",
+            "uri": "/api/v1/system/api",
+            "method": "PUT",
+            "payload": {"apply_delay": 0}
+        }
+    ]
+
+APIE2ETestFirewallApply()
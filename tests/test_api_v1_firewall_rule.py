@@ -17,7 +17,59 @@ import e2e_test_framework
 class APIE2ETestFirewallRule(e2e_test_framework.APIE2ETest):
     uri = "/api/v1/firewall/rule"
     get_tests = [
-        {"name": "Read all firewall rules"}
+        {"name": "Read all firewall rules"},
+        {"name": "Read the first page of firewall rules", "payload": {"limit": 1}},
+        {"name": "Read firewall rules after an offset", "payload": {"limit": 1, "offset": 1}},
+        {"name": "Read selected fields of firewall rules", "payload": {"fields": "tracker,descr,interface"}},
+        {"name": "Read nested fields of firewall rules", "payload": {"fields": ["source__address", "destination"]}},
+        {"name": "Read firewall rules on selected interfaces", "payload": {"interface__in": "wan,lan"}},
+        {"name": "Read firewall rules matching a pattern", "payload": {"tracker__regex": "^[0-9]+$"}},
+        {"name": "Read firewall rules with a description", "payload": {"descr__exists": True}},
+        {"name": "Read firewall rules with a source in a network", "payload": {"source__address__cidr": "10.0.0.0/8"}},
+        {"name": "Read firewall rules in order", "payload": {"order_by": "interface,-tracker__numeric"}},
+        {"name": "Read the newest firewall rule", "payload": {"order_by": ["-created__time"], "limit": 1}},
+        {
+            "name": "Test pagination limit validation",
+            "status": 400,
+            "return": 15,
+            "payload": {"limit": 0}
+        },
+        {
+            "name": "Test pagination offset validation",
+            "status": 400,
+            "return": 16,
+            "payload": {"offset": -1}
+        },
+        {
+            "name": "Test pagination cursor validation",
+            "status": 400,
+            "return": 17,
+            "payload": {"limit": 1, "cursor": "INVALID"}
+        },
+        {
+            "name": "Test fields validation",
+            "status": 400,
+            "return": 18,
+            "payload": {"fields": ["tracker", 1]}
+        },
+        {
+            "name": "Test order by validation",
+            "status": 400,
+            "return": 19,
+            "payload": {"order_by": "tracker,,descr"}
+        },
+        {
+            "name": "Test query regex filter validation",
+            "status": 400,
+            "return": 20,
+            "payload": {"descr__regex": "("}
+        },
+        {
+            "name": "Test query cidr filter validation",
+            "status": 400,
+            "return": 20,
+            "payload": {"source__address__cidr": "10.0.0.0/33"}
+        }
     ]
     post_tests = [
         {
@@ -0,0 +1,90 @@
+# Copyright 2022 Jared Hendrickson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import e2e_test_framework
+
+class APIE2ETestFirewallRuleBulk(e2e_test_framework.APIE2ETest):
+    uri = "/api/v1/firewall/rule/bulk"
+    post_tests = [
+        {
+            "name": "Check rules array type constraint",
+            "status": 400,
+            "return": 4240
+        },
+        {
+            "name": "Check rules array minimum items constraint",
+            "status": 400,
+            "return": 4241,
+            "payload": {
+                "rules": []
+            }
+        },
+        {
+            "name": "Check no rules are created when any rule is invalid",
+            "status": 400,
+            "return": 4246,
+            "payload": {
+                "rules": [
+                    {
+                        "type": "pass",
+                        "interface": "wan",
+                        "ipprotocol": "inet",
+                        "protocol": "any",
+                        "src": "any",
+                        "dst": "any",
+                        "descr": "Bulk rule E2E test"
+                    },
+                    {
+                        "type": "INVALID",
+                        "interface": "wan",
+                        "ipprotocol": "inet",
+                        "protocol": "any",
+                        "src": "any",
+                        "dst": "any"
+                    }
+                ]
+            }
+        },
+        {
+            "name": "Create firewall rules in bulk",
+            "payload": {
+                "apply": True,
+                "rules": [
+                    {
+                        "type": "pass",
+                        "interface": "wan",
+                        "ipprotocol": "inet",
+                        "protocol": "tcp",
+                        "src": "any",
+                        "dst": "any",
+                        "dstport": "443",
+                        "descr": "Bulk rule E2E test"
+                    },
+                    {
+                        "type": "block",
+                        "interface": "wan",
+                        "ipprotocol": "inet",
+                        "protocol": "tcp",
+                        "src": "any",
+                        "dst": "any",
+                        "dstport": "23",
+                        "descr": "Bulk rule E2E test",
+                        "top": True
+                    }
+                ]
+            }
+        }
+    ]
+
+APIE2ETestFirewallRuleBulk()
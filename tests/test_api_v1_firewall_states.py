@@ -16,7 +16,50 @@ import e2e_test_framework
 
 class APIE2ETestFirewallStates(e2e_test_framework.APIE2ETest):
     uri = "/api/v1/firewall/states"
-    get_tests = [{"name": "Read all firewalls states"}]
+    get_tests = [
+        {"name": "Read all firewalls states"},
+        {"name": "Check streamed firewall states are encoded as json_encode() would encode them", "json_encoded": True},
+        {"name": "Read a page of firewall states", "payload": {"limit": 10, "offset": 1}},
+        {"name": "Count firewall states", "payload": {"count": True}},
+        {
+            "name": "Read a page of queried and ordered firewall states",
+            "payload": {"protocol": "tcp", "status__contains": "ESTABLISHED", "order_by": "-age", "limit": 10}
+        },
+        {
+            "name": "Read filtered firewall states",
+            "payload": {"interface": "lan", "protocol": "tcp", "destination": "0.0.0.0/0"}
+        },
+        {
+            "name": "Check interface exists constraint",
+            "status": 400,
+            "return": 4235,
+            "payload": {"interface": "INVALID"}
+        },
+        {
+            "name": "Check protocol options constraint",
+            "status": 400,
+            "return": 4234,
+            "payload": {"protocol": "INVALID"}
+        },
+        {
+            "name": "Check source IP/CIDR constraint",
+            "status": 400,
+            "return": 4232,
+            "payload": {"source": "INVALID"}
+        },
+        {
+            "name": "Check count boolean constraint",
+            "status": 400,
+            "return": 4242,
+            "payload": {"count": "INVALID"}
+        },
+        {
+            "name": "Check count with other query parameters constraint",
+            "status": 400,
+            "return": 4247,
+            "payload": {"count": True, "order_by": "age"}
+        }
+    ]
     delete_tests = [
         {
             "name": "Check firewall state deletion",
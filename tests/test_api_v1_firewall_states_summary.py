@@ -0,0 +1,48 @@
+# Copyright 2022 Jared Hendrickson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import e2e_test_framework
+
+
+class APIE2ETestFirewallStatesSummary(e2e_test_framework.APIE2ETest):
+    uri = "/api/v1/firewall/states/summary"
+    get_tests = [
+        {"name": "Read the top firewall state sources"},
+        {
+            "name": "Read the top firewall state destinations by bytes",
+            "payload": {"group_by": "destination", "metric": "bytes", "top": 5}
+        },
+        {"name": "Read firewall state counts per interface", "payload": {"group_by": "interface", "protocol": "tcp"}},
+        {
+            "name": "Check group_by options constraint",
+            "status": 400,
+            "return": 4243,
+            "payload": {"group_by": "INVALID"}
+        },
+        {
+            "name": "Check metric options constraint",
+            "status": 400,
+            "return": 4244,
+            "payload": {"metric": "INVALID"}
+        },
+        {
+            "name": "Check top positive integer constraint",
+            "status": 400,
+            "return": 4245,
+            "payload": {"top": 0}
+        }
+    ]
+
+
+APIE2ETestFirewallStatesSummary()
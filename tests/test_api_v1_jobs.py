@@ -0,0 +1,51 @@
+# Copyright 2022 Jared Hendrickson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import e2e_test_framework
+
+class APIE2ETestJobs(e2e_test_framework.APIE2ETest):
+    uri = "/api/v1/jobs"
+    post_tests = [
+        {
+            "name": "Queue a service restart as a job",
+            "uri": "/api/v1/services/ntpd/restart",
+            "status": 202,
+            "return": 24,
+            "payload": {"async": True}
+        },
+        {
+            "name": "Check requests are validated before they are queued",
+            "uri": "/api/v1/system/package",
+            "status": 400,
+            "return": 1073,
+            "payload": {"async": True}
+        }
+    ]
+    get_tests = [
+        {"name": "Read all jobs"},
+        {"name": "Read the queued job", "payload": {}},
+        {
+            "name": "Check job not found error",
+            "status": 404,
+            "return": 26,
+            "payload": {"id": "0000000000000000"}
+        }
+    ]
+
+    def post_post(self):
+        # Read the job queued by the first POST test
+        if len(self.post_responses) == 1:
+            self.get_tests[1]["payload"]["id"] = self.post_responses[0]["data"]["id"]
+
+APIE2ETestJobs()
@@ -0,0 +1,71 @@
+# Copyright 2022 Jared Hendrickson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import e2e_test_framework
+
+
+class APIE2ETestRouter(e2e_test_framework.APIE2ETest):
+    uri = "/api/v1/system/version"
+    get_tests = [
+        {
+            "name": "Check HEAD requests of readable endpoints respond without a body",
+            "method": "HEAD",
+            "empty_body": True
+        },
+        {
+            "name": "Check HEAD requests require authentication",
+            "method": "HEAD",
+            "status": 401,
+            "empty_body": True,
+            "auth_payload": {"client-id": "INVALID", "client-token": "INVALID"},
+            "headers": {}
+        },
+        {
+            "name": "Check HEAD requests of endpoints without GET are not allowed",
+            "uri": "/api/v1/access_token",
+            "method": "HEAD",
+            "status": 405,
+            "empty_body": True
+        },
+        {
+            "name": "Check unsupported methods are not allowed",
+            "method": "PATCH",
+            "status": 405,
+            "return": 2
+        },
+        {
+            "name": "Check unknown API URLs are not found",
+            "uri": "/api/v1/system/does_not_exist",
+            "status": 404,
+            "return": 14
+        },
+        {
+            "name": "Check HEAD requests of unknown API URLs are not found",
+            "uri": "/api/v1/system/does_not_exist",
+            "method": "HEAD",
+            "status": 404,
+            "empty_body": True
+        }
+    ]
+
+    def get(self):
+        # Send invalid credentials for the configured auth mode in the authentication test
+        if self.args.auth_mode == "token":
+            self.get_tests[1]["headers"]["Authorization"] = "INVALID INVALID"
+        elif self.args.auth_mode == "jwt":
+            self.get_tests[1]["headers"]["Authorization"] = "Bearer INVALID"
+        super().get()
+
+
+APIE2ETestRouter()
@@ -17,7 +17,10 @@ import e2e_test_framework
 
 class APIE2ETestStatusLogDHCP(e2e_test_framework.APIE2ETest):
     uri = "/api/v1/status/log/dhcp"
-    get_tests = [{"name": "Read the DHCP log"}]
+    get_tests = [
+        {"name": "Read the DHCP log"},
+        {"name": "Read the last lines of the DHCP log", "payload": {"lines": 10}}
+    ]
 
 
 APIE2ETestStatusLogDHCP()
@@ -17,7 +17,53 @@ import e2e_test_framework
 
 class APIE2ETestStatusLogFirewall(e2e_test_framework.APIE2ETest):
     uri = "/api/v1/status/log/firewall"
-    get_tests = [{"name": "Read the firewall log"}]
+    get_tests = [
+        {"name": "Read the firewall log"},
+        {"name": "Read the last lines of the firewall log", "payload": {"lines": 10}},
+        {"name": "Read the firewall log since an offset", "payload": {"lines": 10, "since": 0}},
+        {"name": "Follow the firewall log", "payload": {"lines": 10, "follow": True, "timeout": 1}},
+        {"name": "Read the structured firewall log", "payload": {"lines": 10, "format": "structured"}},
+        {
+            "name": "Read blocked firewall log entries from a network",
+            "payload": {"format": "structured", "action": "block", "src__cidr": "0.0.0.0/0", "timestamp__gte": 0}
+        },
+        {
+            "name": "Test lines validation",
+            "status": 400,
+            "return": 8000,
+            "payload": {"lines": 0}
+        },
+        {
+            "name": "Test since validation",
+            "status": 400,
+            "return": 8001,
+            "payload": {"since": -1}
+        },
+        {
+            "name": "Test format validation",
+            "status": 400,
+            "return": 8002,
+            "payload": {"format": "INVALID"}
+        },
+        {
+            "name": "Test since position validation",
+            "status": 400,
+            "return": 8001,
+            "payload": {"since": "INVALID"}
+        },
+        {
+            "name": "Test follow validation",
+            "status": 400,
+            "return": 8003,
+            "payload": {"follow": "INVALID"}
+        },
+        {
+            "name": "Test timeout validation",
+            "status": 400,
+            "return": 8004,
+            "payload": {"follow": True, "timeout": 61}
+        }
+    ]
 
 
 APIE2ETestStatusLogFirewall()
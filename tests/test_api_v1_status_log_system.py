@@ -17,7 +17,10 @@ import e2e_test_framework
 
 class APIE2ETestStatusLogSystem(e2e_test_framework.APIE2ETest):
     uri = "/api/v1/status/log/system"
-    get_tests = [{"name": "Read the system log"}]
+    get_tests = [
+        {"name": "Read the system log"},
+        {"name": "Read the last lines of the system log", "payload": {"lines": 10}}
+    ]
 
 
 APIE2ETestStatusLogSystem()
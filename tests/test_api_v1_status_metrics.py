@@ -0,0 +1,41 @@
+# Copyright 2022 Jared Hendrickson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import e2e_test_framework
+
+
+class APIE2ETestStatusMetrics(e2e_test_framework.APIE2ETest):
+    uri = "/api/v1/status/metrics"
+    get_tests = [
+        {
+            "name": "Read all metrics",
+            "headers": {"Accept": "application/json"},
+            "resp_time": 5    # Allow a few seconds for uncached metrics to be read
+        },
+        {
+            "name": "Read only gateway and firewall state metrics",
+            "headers": {"Accept": "application/json"},
+            "payload": {"family": "gateway,states"},
+            "resp_time": 3    # Allow a few seconds for uncached metrics to be read
+        },
+        {
+            "name": "Check family choice constraint",
+            "status": 400,
+            "return": 8005,
+            "payload": {"family": "INVALID"}
+        }
+    ]
+
+
+APIE2ETestStatusMetrics()
@@ -20,7 +20,21 @@ class APIE2ETestStatusSystem(e2e_test_framework.APIE2ETest):
     get_tests = [
         {
             "name": "Read the system status",
-            "resp_time": 8
+            "resp_time": 3    # Allow a few seconds for the first snapshot to be collected
+        },
+        {
+            "name": "Read the system status from the latest snapshot"
+        },
+        {
+            "name": "Read the system status without using the latest snapshot",
+            "payload": {"fresh": True},
+            "resp_time": 3    # Allow a few seconds for the metrics to be collected
+        },
+        {
+            "name": "Check fresh boolean constraint",
+            "status": 400,
+            "return": 1086,
+            "payload": {"fresh": "INVALID"}
         }
     ]
 
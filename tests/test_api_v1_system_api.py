@@ -26,6 +26,9 @@ class APIE2ETestSystemAPI(e2e_test_framework.APIE2ETest):
                 "jwt_exp": 86400,
                 "keyhash": "sha512",
                 "keybytes": 64,
+                "apply_delay": 2,
+                "apply_max_delay": 30,
+                "auth_cache_ttl": 30,
                 "allowed_interfaces": ["WAN"],
                 "access_list": ["0::/0", "0.0.0.0/0"]
             },
@@ -37,6 +40,9 @@ class APIE2ETestSystemAPI(e2e_test_framework.APIE2ETest):
                 "jwt_exp": 3600,
                 "keyhash": "sha256",
                 "keybytes": 16,
+                "apply_delay": 0,
+                "apply_max_delay": 10,
+                "auth_cache_ttl": 0,
                 "allowed_interfaces": ["any"],
                 "access_list": []
             },
@@ -57,6 +63,38 @@ class APIE2ETestSystemAPI(e2e_test_framework.APIE2ETest):
                 "jwt_exp": 299
             }
         },
+        {
+            "name": "Test apply delay maximum threshold",
+            "status": 400,
+            "return": 1084,
+            "payload": {
+                "apply_delay": 61
+            }
+        },
+        {
+            "name": "Test apply max delay minimum threshold",
+            "status": 400,
+            "return": 1085,
+            "payload": {
+                "apply_max_delay": 0
+            }
+        },
+        {
+            "name": "Test JWT refresh expiration minimum threshold",
+            "status": 400,
+            "return": 1088,
+            "payload": {
+                "jwt_refresh_exp": 299
+            }
+        },
+        {
+            "name": "Test auth cache TTL maximum threshold",
+            "status": 400,
+            "return": 1087,
+            "payload": {
+                "auth_cache_ttl": 301
+            }
+        },
         {
             "name": "Test invalid hash algorithm",
             "status": 400,
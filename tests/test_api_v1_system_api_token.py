@@ -0,0 +1,72 @@
+# Copyright 2022 Jared Hendrickson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import e2e_test_framework
+
+
+class APIE2ETestSystemAPIToken(e2e_test_framework.APIE2ETest):
+    uri = "/api/v1/system/version"
+    get_tests = [
+        {
+            "name": "Authenticate using a valid API token"
+        },
+        {
+            "name": "Check API tokens that do not match are rejected",
+            "status": 401,
+            "return": 3,
+            "headers": {}
+        },
+        {
+            "name": "Check API tokens of users that do not exist are rejected",
+            "status": 401,
+            "return": 3,
+            "headers": {}
+        },
+        {
+            "name": "Change the hash algorithm used for new API tokens",
+            "uri": "/api/v1/system/api",
+            "method": "PUT",
+            "payload": {"keyhash": "sha512"}
+        },
+        {
+            "name": "Check API tokens hashed with a different algorithm still authenticate"
+        },
+        {
+            "name": "Check API tokens that do not match are rejected with mixed hash algorithms",
+            "status": 401,
+            "return": 3,
+            "headers": {}
+        },
+        {
+            "name": "Revert the hash algorithm used for new API tokens",
+            "uri": "/api/v1/system/api",
+            "method": "PUT",
+            "payload": {"keyhash": "sha256"}
+        }
+    ]
+
+    def get(self):
+        # API tokens are only checked when the API uses token authentication
+        if self.args.auth_mode != "token":
+            self.get_tests = [{"name": "Read the system version"}]
+        else:
+            # Add the Authorization headers for the tokens that must be rejected
+            wrong_token = self.args.username + " " + self.args.password + "INVALID"
+            self.get_tests[1]["headers"]["Authorization"] = wrong_token
+            self.get_tests[2]["headers"]["Authorization"] = "6e6f5f737563685f75736572 " + self.args.password
+            self.get_tests[5]["headers"]["Authorization"] = wrong_token
+        super().get()
+
+
+APIE2ETestSystemAPIToken()
@@ -3,7 +3,10 @@ import e2e_test_framework
 
 class APIE2ETestSystemConfig(e2e_test_framework.APIE2ETest):
     uri = "/api/v1/system/config"
-    get_tests = [{"name": "Read the entire pfSense configuration"}]
+    get_tests = [
+        {"name": "Read the entire pfSense configuration"},
+        {"name": "Check the configuration object is streamed as json_encode() would encode it", "json_encoded": True}
+    ]
 
 
 APIE2ETestSystemConfig()
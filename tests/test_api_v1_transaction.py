@@ -0,0 +1,108 @@
+# Copyright 2022 Jared Hendrickson
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import e2e_test_framework
+
+
+class APIE2ETestTransaction(e2e_test_framework.APIE2ETest):
+    uri = "/api/v1/transaction"
+    post_tests = [
+        {
+            "name": "Check operations array constraint",
+            "status": 400,
+            "return": 21
+        },
+        {
+            "name": "Check operation endpoint validation",
+            "status": 400,
+            "return": 22,
+            "payload": {
+                "operations": [{"endpoint": "/api/v1/INVALID", "method": "POST", "payload": {}}]
+            }
+        },
+        {
+            "name": "Check operation method validation",
+            "status": 400,
+            "return": 22,
+            "payload": {
+                "operations": [{"endpoint": "/api/v1/firewall/alias", "method": "PATCH", "payload": {}}]
+            }
+        },
+        {
+            "name": "Check nested transactions are not allowed",
+            "status": 400,
+            "return": 22,
+            "payload": {
+                "operations": [{"endpoint": "/api/v1/transaction", "method": "POST", "payload": {}}]
+            }
+        },
+        {
+            "name": "Check operations with side effects are not allowed",
+            "status": 400,
+            "return": 22,
+            "payload": {
+                "operations": [{"endpoint": "/api/v1/system/tunable", "method": "POST", "payload": {}}]
+            }
+        },
+        {
+            "name": "Check failed operations rollback the transaction",
+            "status": 400,
+            "return": 23,
+            "payload": {
+                "operations": [
+                    {
+                        "endpoint": "/api/v1/firewall/alias",
+                        "method": "POST",
+                        "payload": {"name": "E2E_TRANSACTION", "type": "host", "address": ["127.0.0.1"]}
+                    },
+                    {
+                        "endpoint": "/api/v1/firewall/rule",
+                        "method": "POST",
+                        "payload": {"type": "INVALID", "interface": "wan"}
+                    }
+                ]
+            }
+        },
+        {
+            "name": "Create aliases in one transaction",
+            "payload": {
+                "operations": [
+                    {
+                        "endpoint": "/api/v1/firewall/alias",
+                        "method": "POST",
+                        "payload": {"name": "E2E_TRANSACTION", "type": "host", "address": ["127.0.0.1"]}
+                    },
+                    {
+                        "endpoint": "/api/v1/firewall/alias",
+                        "method": "POST",
+                        "payload": {"name": "E2E_TRANSACTION_PORTS", "type": "port", "address": [8443]}
+                    }
+                ]
+            },
+            "resp_time": 5    # Allow a few seconds for the firewall filter to reload
+        },
+        {
+            "name": "Delete the aliases in one transaction",
+            "payload": {
+                "operations": [
+                    {"endpoint": "/api/v1/firewall/alias", "method": "DELETE", "payload": {"id": "E2E_TRANSACTION"}},
+                    {"endpoint": "/api/v1/firewall/alias", "method": "DELETE", "payload": {"id": "E2E_TRANSACTION_PORTS"}}
+                ],
+                "apply": False
+            }
+        }
+    ]
+
+
+APIE2ETestTransaction()